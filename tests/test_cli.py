@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from typer.testing import CliRunner
 from dq import app
@@ -17,8 +19,8 @@ def test_validate_success():
     Test the validation command with compliant data.
     Expects exit code 0 and the 'PASSED' success message.
     """
-    result = runner.invoke(app, [VALID_CSV, "--suite", SUITE_JSON])
-    
+    result = runner.invoke(app, ["validate", VALID_CSV, "--suite", SUITE_JSON])
+
     assert result.exit_code == 0
     # Matches the updated output strings in dq.py
     assert "RESULT: DATA QUALITY PASSED" in result.stdout
@@ -29,7 +31,7 @@ def test_validate_failure():
     Expects exit code 1 and the 'FAILED' status message.
     """
     # This test verifies that the engine correctly identifies data quality issues
-    result = runner.invoke(app, [INVALID_CSV, "--suite", SUITE_JSON])
+    result = runner.invoke(app, ["validate", INVALID_CSV, "--suite", SUITE_JSON])
 
     assert result.exit_code == 1
     assert "RESULT: DATA QUALITY FAILED" in result.stdout
@@ -39,8 +41,114 @@ def test_file_not_found():
     Test the CLI robustness when the input source is missing.
     Expects exit code 2 and a clear error message.
     """
-    result = runner.invoke(app, ["non_existent.csv", "--suite", SUITE_JSON])
+    result = runner.invoke(app, ["validate", "non_existent.csv", "--suite", SUITE_JSON])
 
     assert result.exit_code == 2
     # Verifies the exact error message defined in the CLI pre-flight check
-    assert "Input data file not found" in result.stdout
\ No newline at end of file
+    assert "Input data file not found" in result.stdout
+
+def test_validate_many(tmp_path):
+    """
+    Test the bulk validation command against a glob of compliant files.
+    Expects exit code 0 and one JSON report per matched file.
+    """
+    result = runner.invoke(
+        app,
+        ["validate-many", "examples/*.csv", "--suite", SUITE_JSON, "--out-dir", str(tmp_path)],
+    )
+
+    assert result.exit_code == 0
+    assert "PASSED" in result.stdout
+    assert (tmp_path / "result_examples_drug.json").exists()
+
+def _write_suite(tmp_path, name, expectations):
+    """Write a throwaway expectation suite to disk and return its path."""
+    suite_path = tmp_path / f"{name}.json"
+    suite_path.write_text(json.dumps({"name": name, "expectations": expectations}))
+    return suite_path
+
+def test_validate_missing_column(tmp_path):
+    """
+    Test a suite referencing a column the CSV does not have.
+    Expects a clean validation failure, not a parser crash.
+    """
+    suite_path = _write_suite(tmp_path, "missing_column_suite", [
+        {"type": "expect_column_to_exist", "kwargs": {"column": "no_such_column"}},
+        {"type": "expect_column_values_to_not_be_null", "kwargs": {"column": "drug"}},
+    ])
+
+    result = runner.invoke(
+        app, ["validate", VALID_CSV, "--suite", str(suite_path), "--out", str(tmp_path / "r.json")]
+    )
+
+    assert result.exit_code == 1
+    assert "RESULT: DATA QUALITY FAILED" in result.stdout
+
+def test_validate_column_only_suite(tmp_path):
+    """
+    Test a suite with only per-column expectations, which enables column
+    projection and dtype forwarding. Expects the same verdict as a full read.
+    """
+    out = tmp_path / "r.json"
+    suite_path = _write_suite(tmp_path, "projection_suite", [
+        {"type": "expect_column_values_to_be_of_type", "kwargs": {"column": "age", "type_": "int64"}},
+        {"type": "expect_column_values_to_be_between",
+         "kwargs": {"column": "age", "min_value": 0, "max_value": 120}},
+    ])
+
+    result = runner.invoke(app, ["validate", VALID_CSV, "--suite", str(suite_path), "--out", str(out)])
+
+    assert result.exit_code == 0
+    report = json.loads(out.read_bytes())
+    assert report["success"] is True
+    assert report["statistics"]["evaluated_expectations"] == 2
+
+def test_validate_type_expectation_on_categorical_column(tmp_path):
+    """
+    Test a str type expectation on a low-cardinality column eligible for
+    category compaction. The conversion must not change the observed dtype.
+    """
+    suite_path = _write_suite(tmp_path, "typed_string_suite", [
+        {"type": "expect_column_values_to_be_of_type", "kwargs": {"column": "drug", "type_": "str"}},
+    ])
+
+    result = runner.invoke(
+        app, ["validate", VALID_CSV, "--suite", str(suite_path), "--out", str(tmp_path / "r.json")]
+    )
+
+    assert result.exit_code == 0
+    assert "RESULT: DATA QUALITY PASSED" in result.stdout
+
+def test_validate_empty_suite(tmp_path):
+    """
+    Test the short-circuit for a scaffold suite with no expectations.
+    Expects a trivially passing run with a zero-expectation report.
+    """
+    out = tmp_path / "r.json"
+    suite_path = _write_suite(tmp_path, "empty_suite", [])
+
+    result = runner.invoke(app, ["validate", VALID_CSV, "--suite", str(suite_path), "--out", str(out)])
+
+    assert result.exit_code == 0
+    report = json.loads(out.read_bytes())
+    assert report["success"] is True
+    assert report["statistics"]["evaluated_expectations"] == 0
+
+def test_validate_pretty_report(tmp_path):
+    """
+    Test the report formatting switch. Both variants must parse as JSON;
+    only the pretty one carries indentation.
+    """
+    compact_out, pretty_out = tmp_path / "compact.json", tmp_path / "pretty.json"
+
+    compact = runner.invoke(app, ["validate", VALID_CSV, "--suite", SUITE_JSON, "--out", str(compact_out)])
+    pretty = runner.invoke(
+        app, ["validate", VALID_CSV, "--suite", SUITE_JSON, "--out", str(pretty_out), "--pretty"]
+    )
+
+    assert compact.exit_code == 0 and pretty.exit_code == 0
+    compact_bytes, pretty_bytes = compact_out.read_bytes(), pretty_out.read_bytes()
+    assert json.loads(compact_bytes)["success"] is True
+    assert json.loads(pretty_bytes)["success"] is True
+    assert b"\n" not in compact_bytes
+    assert len(pretty_bytes) > len(compact_bytes)